@@ -4,25 +4,33 @@ from bson import ObjectId
 from fastapi import Depends, HTTPException, status
 from jwt.exceptions import InvalidTokenError
 from .schemas import TokenDataModel
-from .config import oauth2_scheme, SECRET_KEY, ALGORITHM
+from .config import oauth2_scheme
+from src.config import Settings
+from src.dependencies import get_settings, get_single_flight
+from src.singleflight import make_key
 from src.users.schemas import UserModel
 from src.users.dependencies import get_user_collection
 
-async def validate_token(token: Annotated[str, Depends(oauth2_scheme)], user_collection = Depends(get_user_collection)):
+USER_LOOKUP = 'validate_token'
+
+async def validate_token(token: Annotated[str, Depends(oauth2_scheme)], user_collection = Depends(get_user_collection), settings: Settings = Depends(get_settings), single_flight = Depends(get_single_flight)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail='Could not validate credentials',
         headers={'WWW-Authenticate': 'Bearer'}
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         id = payload.get('sub')
         if id is None:
             raise credentials_exception
         token_data = TokenDataModel(id=id)
     except InvalidTokenError:
         raise credentials_exception
-    user = await user_collection.find_one({ '_id': ObjectId(token_data.id) })
+    async def find_user():
+        return await user_collection.find_one({ '_id': ObjectId(token_data.id) })
+
+    user = await single_flight.do(make_key(USER_LOOKUP, token_data.id), find_user)
     if user is None:
         raise credentials_exception
     return UserModel(**user)
\ No newline at end of file
@@ -4,6 +4,10 @@ from .schemas import TokenModel
 from .utils import verify_password, hash_password, create_access_token
 from src.users.schemas import UserModel
 from src.users.dependencies import get_user_collection
+from src.config import Settings
+from src.dependencies import get_settings
+from src.breach.dependencies import get_breach_index
+from src.breach.utils import ensure_not_breached
 
 auth_router = APIRouter(prefix='')
 
@@ -11,7 +15,7 @@ auth_router = APIRouter(prefix='')
     '/sign-in', 
     response_model=TokenModel
 )
-async def sign_in(data: OAuth2PasswordRequestForm = Depends(), user_collection = Depends(get_user_collection)):
+async def sign_in(data: OAuth2PasswordRequestForm = Depends(), user_collection = Depends(get_user_collection), settings: Settings = Depends(get_settings)):
     user = await user_collection.find_one({ 'email': data.username })
     if user is None:
         raise HTTPException(
@@ -25,7 +29,8 @@ async def sign_in(data: OAuth2PasswordRequestForm = Depends(), user_collection =
             detail='Incorrect email or password',
         )
     access_token = create_access_token(
-        data={ 'sub': stored_user.id }
+        data={ 'sub': stored_user.id },
+        settings=settings
     )
     return TokenModel(access_token=access_token, token_type='bearer')
 
@@ -34,7 +39,8 @@ async def sign_in(data: OAuth2PasswordRequestForm = Depends(), user_collection =
     response_model=UserModel,
     status_code=201
 )
-async def sign_up(data: UserModel, user_collection = Depends(get_user_collection)):
+async def sign_up(data: UserModel, user_collection = Depends(get_user_collection), breach_index = Depends(get_breach_index)):
+    ensure_not_breached(breach_index, data.password)
     hashed_password = hash_password(data.password)
     user_data = data.model_dump(exclude=['id'], mode='json')
     user_data['password'] = hashed_password
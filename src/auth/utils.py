@@ -1,6 +1,7 @@
 import jwt
-from .config import pwd_context, SECRET_KEY, ALGORITHM
+from .config import pwd_context
 from datetime import datetime, timedelta, timezone
+from src.config import Settings
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -8,12 +9,12 @@ def verify_password(plain_password, hashed_password):
 def hash_password(plain_password):
     return pwd_context.hash(plain_password)
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None):
+def create_access_token(data: dict, settings: Settings, expires_delta: timedelta | None = None):
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode.update({ 'exp': expire })
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)   
-    return encoded_jwt
\ No newline at end of file
+    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)   
+    return encoded_jwt
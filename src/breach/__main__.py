@@ -0,0 +1,18 @@
+import argparse
+from .index import build_index
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m src.breach',
+        description='Build a breached password index from a Pwned-Passwords SHA-1 dump ordered by hash'
+    )
+    parser.add_argument('source', help='SHA-1 dump with one "HASH:count" per line')
+    parser.add_argument('dest', help='output index file')
+    args = parser.parse_args()
+
+    with open(args.source, encoding='utf-8') as source, open(args.dest, 'wb') as dest:
+        count = build_index(source, dest)
+    print(f'Wrote {count} hashes to {args.dest}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+from fastapi import Request
+from .index import BreachIndex
+
+def get_breach_index(request: Request) -> BreachIndex | None:
+    return request.app.state.breach_index
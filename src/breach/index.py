@@ -0,0 +1,111 @@
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from typing import BinaryIO, TextIO
+
+# Layout: header, then a table of BUCKETS + 1 record offsets keyed by the first
+# two bytes of the SHA-1, then the sorted records. Each record stores only the
+# remaining 18 bytes since the prefix is implied by its bucket.
+MAGIC = b'FBPI'
+VERSION = 1
+HEADER = struct.Struct('<4sIQ')
+OFFSET = struct.Struct('<Q')
+PREFIX_SIZE = 2
+DIGEST_SIZE = 20
+RECORD_SIZE = DIGEST_SIZE - PREFIX_SIZE
+BUCKETS = 1 << (PREFIX_SIZE * 8)
+TABLE_SIZE = OFFSET.size * (BUCKETS + 1)
+DATA_OFFSET = HEADER.size + TABLE_SIZE
+
+def sha1_digest(password: str) -> bytes:
+    return hashlib.sha1(password.encode('utf-8')).digest()
+
+def parse_dump_line(line: str) -> bytes:
+    digest = line.strip().split(':', 1)[0]
+    if len(digest) != DIGEST_SIZE * 2:
+        raise ValueError(f'Invalid SHA-1 hash {digest!r}')
+    return bytes.fromhex(digest)
+
+# Streams a Pwned-Passwords style dump ("SHA1:count" lines, ordered by hash)
+# into the index format and returns the number of records written.
+def build_index(source: TextIO, dest: BinaryIO) -> int:
+    counts = [0] * BUCKETS
+    dest.write(HEADER.pack(MAGIC, VERSION, 0))
+    dest.write(bytes(TABLE_SIZE))
+
+    previous = b''
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        digest = parse_dump_line(line)
+        if digest == previous:
+            continue
+        if digest < previous:
+            raise ValueError(f'Dump is not ordered by hash at line {line_number}')
+        counts[int.from_bytes(digest[:PREFIX_SIZE], 'big')] += 1
+        dest.write(digest[PREFIX_SIZE:])
+        previous = digest
+
+    offsets = bytearray(TABLE_SIZE)
+    total = 0
+    for bucket, count in enumerate(counts):
+        OFFSET.pack_into(offsets, OFFSET.size * bucket, total)
+        total += count
+    OFFSET.pack_into(offsets, OFFSET.size * BUCKETS, total)
+
+    dest.seek(0)
+    dest.write(HEADER.pack(MAGIC, VERSION, total))
+    dest.write(offsets)
+    return total
+
+class BreachIndex:
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < DATA_OFFSET:
+                raise ValueError(f'{path} is not a breached password index')
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.count = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f'{path} is not a breached password index')
+            if len(self._mmap) != DATA_OFFSET + self.count * RECORD_SIZE:
+                raise ValueError(f'{path} is truncated')
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def close(self):
+        self._mmap.close()
+
+    def __len__(self):
+        return self.count
+
+    def contains_hash(self, digest: bytes) -> bool:
+        bucket = int.from_bytes(digest[:PREFIX_SIZE], 'big')
+        low, high = struct.unpack_from('<QQ', self._mmap, HEADER.size + OFFSET.size * bucket)
+        suffix = digest[PREFIX_SIZE:]
+        while low < high:
+            middle = (low + high) // 2
+            start = DATA_OFFSET + middle * RECORD_SIZE
+            record = self._mmap[start:start + RECORD_SIZE]
+            if record < suffix:
+                low = middle + 1
+            elif record > suffix:
+                high = middle
+            else:
+                return True
+        return False
+
+    def contains(self, password: str) -> bool:
+        return self.contains_hash(sha1_digest(password))
+
+    def contains_many(self, passwords: Iterable[str]) -> list[bool]:
+        digests = [sha1_digest(password) for password in passwords]
+        # Looking hashes up in sorted order keeps page faults on adjacent pages
+        order = sorted(range(len(digests)), key=digests.__getitem__)
+        result = [False] * len(digests)
+        for i in order:
+            result[i] = self.contains_hash(digests[i])
+        return result
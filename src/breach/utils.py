@@ -0,0 +1,9 @@
+from fastapi import HTTPException
+from .index import BreachIndex
+
+def ensure_not_breached(breach_index: BreachIndex | None, password: str):
+    if breach_index is not None and breach_index.contains(password):
+        raise HTTPException(
+            status_code=400,
+            detail='Password has appeared in a data breach',
+        )
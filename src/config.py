@@ -0,0 +1,33 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+
+class Settings(BaseModel):
+    secret_key: str = Field(...)
+    mongo_uri: str = 'mongodb://localhost:27017'
+    db_name: str = Field(...)
+    test_db_name: str | None = None
+    algorithm: str = 'HS256'
+    access_token_expire_minutes: int = 30
+    profile_startup: bool = False
+    breached_passwords_path: str | None = None
+
+    @classmethod
+    def from_env(cls, env_file: str | None = None):
+        load_dotenv(env_file)
+        values = {
+            'secret_key': os.getenv('SECRET_KEY'),
+            'mongo_uri': os.getenv('MONGO_URI'),
+            'db_name': os.getenv('DB_NAME'),
+            'test_db_name': os.getenv('TEST_DB_NAME'),
+            'algorithm': os.getenv('JWT_ALGORITHM'),
+            'access_token_expire_minutes': os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES'),
+            'profile_startup': os.getenv('PROFILE_STARTUP'),
+            'breached_passwords_path': os.getenv('BREACHED_PASSWORDS_PATH'),
+        }
+        return cls(**{k: v for k, v in values.items() if v is not None})
+
+@lru_cache
+def load_settings() -> Settings:
+    return Settings.from_env()
@@ -1,11 +1,5 @@
-import os
-from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
+from .config import Settings
 
-load_dotenv()
-
-MONGO_URI = os.getenv('MONGO_URI')
-DB_NAME = os.getenv('DB_NAME')
-
-client = AsyncIOMotorClient(MONGO_URI)
-db = client[DB_NAME]
\ No newline at end of file
+def create_client(settings: Settings) -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(settings.mongo_uri)
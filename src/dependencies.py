@@ -1,4 +1,12 @@
-from .db import db
+from fastapi import Request
+from .config import Settings
+from .singleflight import SingleFlight
 
-def get_db():
-    return db
\ No newline at end of file
+def get_db(request: Request):
+    return request.app.state.db
+
+def get_settings(request: Request) -> Settings:
+    return request.app.state.settings
+
+def get_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.single_flight
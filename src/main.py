@@ -1,10 +1,60 @@
+import time
+
+IMPORT_STARTED = time.perf_counter()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .auth.router import auth_router
-from .users.router import users_router
-from .secrets.router import secrets_router
+from .config import Settings, load_settings
+from .profiling import StartupProfile
+from .singleflight import SingleFlight
+
+ROUTERS = (
+    ('src.auth.router', 'auth_router'),
+    ('src.users.router', 'users_router'),
+    ('src.secrets.router', 'secrets_router'),
+    ('src.metrics.router', 'metrics_router'),
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = app.state.settings
+    profile = app.state.startup_profile
+    client = None
+    try:
+        create_client = profile.import_module('src.db').create_client
+        with profile.measure('init', 'src.db'):
+            client = create_client(settings)
+            app.state.db = client[settings.db_name]
+        if settings.breached_passwords_path:
+            BreachIndex = profile.import_module('src.breach.index').BreachIndex
+            with profile.measure('init', 'src.breach'):
+                app.state.breach_index = BreachIndex(settings.breached_passwords_path)
+        if settings.profile_startup:
+            profile.report()
+        yield
+    finally:
+        if client is not None:
+            client.close()
+        if app.state.breach_index is not None:
+            app.state.breach_index.close()
+            app.state.breach_index = None
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    profile = StartupProfile()
+    profile.record('import', 'src.main', IMPORT_TIME)
+    with profile.measure('init', 'src.config'):
+        settings = settings or load_settings()
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.settings = settings
+    app.state.startup_profile = profile
+    app.state.single_flight = SingleFlight()
+    app.state.breach_index = None
+
+    for module_name, router_name in ROUTERS:
+        module = profile.import_module(module_name)
+        app.include_router(getattr(module, router_name))
 
-app = FastAPI()
+    return app
 
-app.include_router(auth_router)
-app.include_router(users_router)
-app.include_router(secrets_router)
\ No newline at end of file
+IMPORT_TIME = time.perf_counter() - IMPORT_STARTED
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from .schemas import MetricsModel
+from src.dependencies import get_single_flight
+
+metrics_router = APIRouter(prefix='/metrics')
+
+@metrics_router.get(
+    '/',
+    response_description='Request coalescing metrics',
+    response_model=MetricsModel
+)
+async def get_metrics(single_flight = Depends(get_single_flight)):
+    return MetricsModel(single_flight=single_flight.snapshot())
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+class SingleFlightMetricsModel(BaseModel):
+    route: str
+    calls: int
+    shared: int
+    invalidations: int
+    coalescing_rate: float
+
+class MetricsModel(BaseModel):
+    single_flight: list[SingleFlightMetricsModel]
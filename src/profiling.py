@@ -0,0 +1,42 @@
+import logging
+import time
+from contextlib import contextmanager
+from importlib import import_module
+
+# uvicorn configures its error logger at INFO, so the report shows up in the
+# server output without the app having to set up logging itself
+logger = logging.getLogger('uvicorn.error')
+
+class StartupProfile:
+    def __init__(self):
+        self.entries: list[tuple[str, str, float]] = []
+
+    def record(self, phase: str, name: str, elapsed: float):
+        self.entries.append((phase, name, elapsed))
+
+    @contextmanager
+    def measure(self, phase: str, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, name, time.perf_counter() - start)
+
+    def import_module(self, name: str):
+        with self.measure('import', name):
+            return import_module(name)
+
+    @property
+    def total(self) -> float:
+        return sum(elapsed for _, _, elapsed in self.entries)
+
+    def as_dict(self) -> list[dict]:
+        return [
+            { 'phase': phase, 'module': name, 'ms': round(elapsed * 1000, 3) }
+            for phase, name, elapsed in self.entries
+        ]
+
+    def report(self):
+        for phase, name, elapsed in self.entries:
+            logger.info('startup %-6s %-20s %8.3f ms', phase, name, elapsed * 1000)
+        logger.info('startup total %.3f ms', self.total * 1000)
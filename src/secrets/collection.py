@@ -1,3 +0,0 @@
-from src.db import db
-
-secret_collection = db.get_collection('secrets')
\ No newline at end of file
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from bson import ObjectId
 from pymongo import ReturnDocument
 
-from .schemas import PyObjectId, SecretModel, UpdateSecretModel, SecretCollection
+from .schemas import PyObjectId, SecretModel, UpdateSecretModel, SecretCollection, BreachedSecretCollection
 from .dependencies import get_secret_collection
 
 from src.users.schemas import UserModel
 from src.auth.dependencies import validate_token
+from src.dependencies import get_single_flight
+from src.singleflight import make_key
+from src.breach.dependencies import get_breach_index
 
 secrets_router = APIRouter(prefix='/secrets')
 
@@ -16,9 +19,33 @@ secrets_router = APIRouter(prefix='/secrets')
     response_model=SecretCollection,
     response_model_by_alias=False
 )
-async def get_secrets(user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection)):
-    secrets = await secret_collection.find({ 'owner_id': ObjectId(user.id) }).to_list()
-    return SecretCollection(secrets=secrets)
+async def get_secrets(request: Request, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection), single_flight = Depends(get_single_flight)):
+    async def render():
+        secrets = await secret_collection.find({ 'owner_id': ObjectId(user.id) }).to_list()
+        return SecretCollection(secrets=secrets).model_dump_json()
+
+    key = make_key('/secrets', user.id, request.query_params.multi_items())
+    body = await single_flight.do(key, render)
+    return Response(content=body, media_type='application/json')
+
+@secrets_router.get(
+    '/breached',
+    response_description='List secrets whose password appeared in a data breach',
+    response_model=BreachedSecretCollection
+)
+async def get_breached_secrets(user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection), breach_index = Depends(get_breach_index)):
+    if breach_index is None:
+        raise HTTPException(status_code=503, detail='Breached password index is not configured')
+
+    secrets = await secret_collection.find(
+        { 'owner_id': ObjectId(user.id), 'content.type': 'login', 'content.password': { '$type': 'string' } },
+        { 'content.password': 1 }
+    ).to_list()
+    breached = breach_index.contains_many([secret['content']['password'] for secret in secrets])
+
+    return BreachedSecretCollection(
+        secret_ids=[secret['_id'] for secret, is_breached in zip(secrets, breached) if is_breached]
+    )
 
 @secrets_router.get(
     '/{secret_id}',
@@ -47,10 +74,11 @@ async def get_secret(secret_id: PyObjectId, user: UserModel = Depends(validate_t
     response_model=SecretModel,
     response_model_by_alias=False
 )
-async def create_secret(data: SecretModel, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection)):
+async def create_secret(data: SecretModel, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection), single_flight = Depends(get_single_flight)):
     secret = data.model_dump(exclude=['id'], mode='json')
     secret['owner_id'] = ObjectId(user.id)
     new_secret = await secret_collection.insert_one(secret)
+    single_flight.invalidate('/secrets', user.id)
     created_secret = await secret_collection.find_one({ 
         '_id': new_secret.inserted_id,
         'owner_id': ObjectId(user.id)
@@ -63,7 +91,7 @@ async def create_secret(data: SecretModel, user: UserModel = Depends(validate_to
     response_model=SecretModel,
     response_model_by_alias=False
 )
-async def update_secret(secret_id: PyObjectId, data: UpdateSecretModel, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection)):
+async def update_secret(secret_id: PyObjectId, data: UpdateSecretModel, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection), single_flight = Depends(get_single_flight)):
     secret = {k: v for k, v in data.model_dump(by_alias=True, mode='json').items() if v is not None}
 
     if len(secret) >= 1:
@@ -72,6 +100,7 @@ async def update_secret(secret_id: PyObjectId, data: UpdateSecretModel, user: Us
             {'$set': secret},
             return_document=ReturnDocument.AFTER,
         )
+        single_flight.invalidate('/secrets', user.id)
 
         if update_result is not None:
             return update_result
@@ -88,8 +117,9 @@ async def update_secret(secret_id: PyObjectId, data: UpdateSecretModel, user: Us
     status_code=204,
     response_description='Delete a secret'    
 )
-async def delete_secret(secret_id: PyObjectId, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection)):
+async def delete_secret(secret_id: PyObjectId, user: UserModel = Depends(validate_token), secret_collection = Depends(get_secret_collection), single_flight = Depends(get_single_flight)):
     delete_result = await secret_collection.delete_one({ '_id': ObjectId(secret_id), 'owner_id': ObjectId(user.id) })
+    single_flight.invalidate('/secrets', user.id)
     if delete_result.deleted_count == 0:
         raise HTTPException(status_code=404, detail=f'Secret {secret_id} not found')
     return
\ No newline at end of file
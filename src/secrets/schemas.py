@@ -70,4 +70,7 @@ class UpdateSecretModel(BaseModel):
     )
 
 class SecretCollection(BaseModel):
-    secrets: list[SecretModel]
\ No newline at end of file
+    secrets: list[SecretModel]
+
+class BreachedSecretCollection(BaseModel):
+    secret_ids: list[PyObjectId]
\ No newline at end of file
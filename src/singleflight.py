@@ -0,0 +1,51 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from functools import partial
+from typing import Any
+
+def make_key(route: str, owner_id: Any, params: Iterable[tuple[str, str]] = ()) -> tuple:
+    return (route, str(owner_id), tuple(sorted(params)))
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self._stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: { 'calls': 0, 'shared': 0, 'invalidations': 0 }
+        )
+
+    async def do(self, key: tuple, fn: Callable[[], Awaitable[Any]]):
+        stats = self._stats[key[0]]
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._done, key))
+            stats['calls'] += 1
+        else:
+            stats['shared'] += 1
+        # Shielded so a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _done(self, key: tuple, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, route: str, owner_id: Any):
+        owner_id = str(owner_id)
+        for key in [key for key in self._calls if key[:2] == (route, owner_id)]:
+            del self._calls[key]
+        self._stats[route]['invalidations'] += 1
+
+    def snapshot(self) -> list[dict]:
+        snapshot = []
+        for route, stats in self._stats.items():
+            requests = stats['calls'] + stats['shared']
+            snapshot.append({
+                'route': route,
+                **stats,
+                'coalescing_rate': stats['shared'] / requests if requests else 0.0,
+            })
+        return snapshot
@@ -1,5 +0,0 @@
-from src.dependencies import get_db
-
-db = get_db()
-
-user_collection = db.get_collection('users')
\ No newline at end of file
@@ -4,7 +4,10 @@ from pymongo import ReturnDocument
 from .schemas import UserModel, UpdateUserModel
 from .dependencies import get_user_collection
 from src.auth.utils import hash_password
-from src.auth.dependencies import validate_token
+from src.auth.dependencies import validate_token, USER_LOOKUP
+from src.dependencies import get_single_flight
+from src.breach.dependencies import get_breach_index
+from src.breach.utils import ensure_not_breached
 
 users_router = APIRouter(prefix='/users')
 
@@ -23,11 +26,12 @@ async def get_user(user: UserModel = Depends(validate_token)):
     response_model=UserModel,
     response_model_by_alias=False
 )
-async def update_user(data: UpdateUserModel, user_collection = Depends(get_user_collection), user: UserModel = Depends(validate_token)):    
+async def update_user(data: UpdateUserModel, user_collection = Depends(get_user_collection), user: UserModel = Depends(validate_token), single_flight = Depends(get_single_flight), breach_index = Depends(get_breach_index)):    
     user_data = {k: v for k, v in data.model_dump(by_alias=True, mode='json').items() if v is not None}
     password = user_data.get('password', None)
 
     if password:
+        ensure_not_breached(breach_index, password)
         password = hash_password(password)
         user_data['password'] = password
 
@@ -37,6 +41,7 @@ async def update_user(data: UpdateUserModel, user_collection = Depends(get_user_
             {"$set": user_data},
             return_document=ReturnDocument.AFTER,
         )
+        single_flight.invalidate(USER_LOOKUP, user.id)
 
         if update_result is not None:
             return update_result
@@ -53,10 +58,11 @@ async def update_user(data: UpdateUserModel, user_collection = Depends(get_user_
     status_code=204,
     response_description='Delete a user'
 )
-async def delete_user(user: UserModel = Depends(validate_token), user_collection = Depends(get_user_collection)):
+async def delete_user(user: UserModel = Depends(validate_token), user_collection = Depends(get_user_collection), single_flight = Depends(get_single_flight)):
     delete_result = await user_collection.delete_one(
         { '_id': ObjectId(user.id) }
     )
+    single_flight.invalidate(USER_LOOKUP, user.id)
 
     if delete_result.deleted_count == 0:
         raise HTTPException(status_code=404, detail=f"User {user.id} not found")
\ No newline at end of file
@@ -3,6 +3,7 @@ import pytest
 from tests.utils import make_user_payload, make_sign_in_payload
 from src.auth.utils import verify_password
 from src.auth.dependencies import validate_token
+from src.singleflight import SingleFlight
 
 @pytest.mark.asyncio
 async def test_sign_up(client, test_db):
@@ -21,14 +22,14 @@ async def test_sign_up(client, test_db):
     assert verify_password(data['password'], user['password'])
 
 @pytest.mark.asyncio
-async def test_sign_in(client, test_db, test_user):
+async def test_sign_in(client, test_db, test_user, settings):
     data = make_sign_in_payload(username=test_user['email'], password=test_user['unhashed_password'])
 
     response = await client.post('/sign-in', data=data)
     assert response.status_code == 200
 
     token = response.json()
-    user = await validate_token(token['access_token'], test_db['users'])
+    user = await validate_token(token['access_token'], test_db['users'], settings, SingleFlight())
 
     assert user.id == str(test_user['_id'])
 
@@ -51,3 +52,12 @@ async def test_sign_in_with_invalid_password(client, test_user):
 
     assert response.status_code == 401
     assert response_data['detail'] == 'Incorrect email or password'
+
+@pytest.mark.asyncio
+async def test_sign_up_with_breached_password(client, test_db, breach_index):
+    data = make_user_payload({'email': 'breached@example.com'})
+
+    response = await client.post('/sign-up', json=data)
+
+    assert response.status_code == 400
+    assert await test_db['users'].find_one({ 'email': data['email'] }) is None
@@ -1,5 +1,8 @@
+import asyncio
 import pytest
+from types import SimpleNamespace
 from bson import ObjectId
+from src.secrets.dependencies import get_secret_collection
 
 @pytest.mark.asyncio
 async def test_get_secret(client, test_secret, override_authentication):
@@ -23,4 +26,111 @@ async def test_get_secret_not_found(client, override_authentication):
 async def test_get_secret_invalid_id(client, override_authentication):
     invalid_id = 'invalid_id'
     response = await client.get(f'/secrets/{invalid_id}')
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_get_breached_secrets(client, test_secret, override_authentication, breach_index):
+    response = await client.get('/secrets/breached')
+    assert response.status_code == 200
+
+    assert response.json()['secret_ids'] == [str(test_secret['_id'])]
+
+@pytest.mark.asyncio
+async def test_get_breached_secrets_without_index(client, override_authentication):
+    response = await client.get('/secrets/breached')
+    assert response.status_code == 503
+
+
+def make_secret_payload(name: str = 'string') -> dict:
+    return {
+        'name': name,
+        'content': {
+            'type': 'login',
+            'email': 'test@example.com',
+            'password': 'string'
+        }
+    }
+
+@pytest.mark.asyncio
+async def test_get_secrets_after_create(client, override_authentication):
+    response = await client.get('/secrets/')
+    assert response.json()['secrets'] == []
+
+    created = await client.post('/secrets/', json=make_secret_payload())
+    assert created.status_code == 201
+
+    response = await client.get('/secrets/')
+    assert response.status_code == 200
+    assert [secret['id'] for secret in response.json()['secrets']] == [created.json()['id']]
+
+@pytest.mark.asyncio
+async def test_get_secrets_after_update(client, override_authentication):
+    secret_id = (await client.post('/secrets/', json=make_secret_payload())).json()['id']
+    response = await client.get('/secrets/')
+    assert response.json()['secrets'][0]['name'] == 'string'
+
+    response = await client.put(f'/secrets/{secret_id}', json={ 'name': 'updated' })
+    assert response.status_code == 200
+
+    response = await client.get('/secrets/')
+    assert response.json()['secrets'][0]['name'] == 'updated'
+
+@pytest.mark.asyncio
+async def test_get_secrets_after_delete(client, override_authentication):
+    secret_id = (await client.post('/secrets/', json=make_secret_payload())).json()['id']
+    response = await client.get('/secrets/')
+    assert len(response.json()['secrets']) == 1
+
+    response = await client.delete(f'/secrets/{secret_id}')
+    assert response.status_code == 204
+
+    response = await client.get('/secrets/')
+    assert response.json()['secrets'] == []
+
+@pytest.mark.asyncio
+async def test_metrics(client, override_authentication):
+    await client.get('/secrets/')
+    await client.get('/secrets/')
+    await client.post('/secrets/', json=make_secret_payload())
+
+    response = await client.get('/metrics/')
+    assert response.status_code == 200
+
+    metrics = { entry['route']: entry for entry in response.json()['single_flight'] }
+    assert metrics['/secrets']['calls'] == 2
+    assert metrics['/secrets']['invalidations'] == 1
+    assert metrics['/secrets']['shared'] == 0
+    assert metrics['/secrets']['coalescing_rate'] == 0.0
+
+class SlowCollection:
+    def __init__(self, collection):
+        self.collection = collection
+        self.queries = 0
+
+    def find(self, *args, **kwargs):
+        self.queries += 1
+        cursor = self.collection.find(*args, **kwargs)
+
+        async def to_list():
+            await asyncio.sleep(0.05)
+            return await cursor.to_list()
+
+        return SimpleNamespace(to_list=to_list)
+
+@pytest.mark.asyncio
+async def test_concurrent_get_secrets_share_one_query(app, client, test_db, test_secret, override_authentication):
+    secret_collection = SlowCollection(test_db['secrets'])
+    app.dependency_overrides[get_secret_collection] = lambda: secret_collection
+    requests = 5
+
+    responses = await asyncio.gather(*[client.get('/secrets/') for _ in range(requests)])
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({ response.content for response in responses }) == 1
+    assert [secret['id'] for secret in responses[0].json()['secrets']] == [str(test_secret['_id'])]
+    assert secret_collection.queries == 1
+
+    metrics = { entry['route']: entry for entry in (await client.get('/metrics/')).json()['single_flight'] }
+    assert metrics['/secrets']['calls'] == 1
+    assert metrics['/secrets']['shared'] == requests - 1
+    assert metrics['/secrets']['coalescing_rate'] == (requests - 1) / requests
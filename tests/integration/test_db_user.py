@@ -1,9 +1,8 @@
 import pytest
 from tests.utils import make_user_payload
-from src.main import app
 from src.users.schemas import UserModel
 from src.auth.utils import verify_password
-from src.auth.dependencies import validate_token
+from src.auth.dependencies import validate_token, USER_LOOKUP
 
 @pytest.mark.asyncio
 async def test_me(client, test_token):
@@ -107,4 +106,33 @@ async def test_delete_user_valid_token_deleted_user(client, test_user, test_db,
     
     response = await client.delete('/users/')
 
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_user_with_breached_password(client, test_db, test_user, override_authentication, breach_index):
+    data = make_user_payload(override={'password': '123456'}, exclude=['name', 'last_name', 'email'])
+
+    response = await client.put('/users/', json=data)
+
+    user = await test_db['users'].find_one({ '_id': test_user['_id'] })
+
+    assert response.status_code == 400
+    assert user['password'] == test_user['password']
+
+
+@pytest.mark.asyncio
+async def test_me_after_update(client, test_token):
+    headers = { 'Authorization': f'Bearer {test_token}'}
+
+    response = await client.get('/users/me', headers=headers)
+    assert response.json()['name'] == 'Test'
+
+    response = await client.put('/users/', json={ 'name': 'Updated' }, headers=headers)
+    assert response.status_code == 200
+
+    response = await client.get('/users/me', headers=headers)
+    assert response.json()['name'] == 'Updated'
+
+    metrics = { entry['route']: entry for entry in (await client.get('/metrics/')).json()['single_flight'] }
+    assert metrics[USER_LOOKUP]['invalidations'] == 1
@@ -0,0 +1,51 @@
+import sys
+import pytest
+from src.config import Settings
+from src.main import create_app, lifespan
+from src.profiling import StartupProfile
+
+def make_settings(**override) -> Settings:
+    return Settings(**{ 'secret_key': 'secret', 'db_name': 'test', **override })
+
+def test_create_app_uses_given_settings():
+    settings = make_settings()
+    app = create_app(settings)
+
+    assert app.state.settings is settings
+    assert not hasattr(app.state, 'db')
+
+def test_create_app_records_startup_profile():
+    app = create_app(make_settings())
+    profile = app.state.startup_profile.as_dict()
+    modules = [entry['module'] for entry in profile if entry['phase'] == 'import']
+
+    assert modules == ['src.main', 'src.auth.router', 'src.users.router', 'src.secrets.router', 'src.metrics.router']
+    assert all(entry['ms'] >= 0 for entry in profile)
+
+def test_startup_profile_import_module():
+    profile = StartupProfile()
+    module = profile.import_module('json')
+
+    assert module is sys.modules['json']
+    assert profile.entries[0][:2] == ('import', 'json')
+
+@pytest.mark.asyncio
+async def test_lifespan_records_resource_initialization():
+    app = create_app(make_settings())
+
+    async with lifespan(app):
+        assert app.state.db.name == 'test'
+
+    entries = [entry[:2] for entry in app.state.startup_profile.entries]
+    assert ('import', 'src.db') in entries
+    assert ('init', 'src.db') in entries
+
+@pytest.mark.asyncio
+async def test_lifespan_fails_on_missing_breach_index(tmp_path):
+    app = create_app(make_settings(breached_passwords_path=str(tmp_path / 'missing.bin')))
+
+    with pytest.raises(FileNotFoundError):
+        async with lifespan(app):
+            pass
+
+    assert app.state.breach_index is None
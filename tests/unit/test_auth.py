@@ -1,7 +1,7 @@
 import jwt
+from datetime import datetime, timedelta, timezone
 from bson import ObjectId
 from src.auth.utils import hash_password, verify_password, create_access_token
-from src.auth.config import SECRET_KEY, ALGORITHM
 
 def test_verify_password():
     password = 'foo'
@@ -11,9 +11,18 @@ def test_verify_password():
     assert verify_password(password, hashed_password) == True
     assert verify_password('bar', hashed_password) == False
 
-def test_create_access_token():
+def test_create_access_token(settings):
     fake_id = str(ObjectId())
-    token = create_access_token({ 'sub': fake_id })
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    token = create_access_token({ 'sub': fake_id }, settings)
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
 
     assert payload['sub'] == fake_id
+
+def test_create_access_token_uses_expire_setting(settings):
+    settings = settings.model_copy(update={ 'access_token_expire_minutes': 5 })
+    token = create_access_token({ 'sub': str(ObjectId()) }, settings)
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    expire = datetime.fromtimestamp(payload['exp'], timezone.utc)
+
+    assert expire - datetime.now(timezone.utc) <= timedelta(minutes=5)
+    assert expire - datetime.now(timezone.utc) > timedelta(minutes=4)
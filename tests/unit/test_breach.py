@@ -0,0 +1,47 @@
+import io
+import pytest
+from src.breach.index import BreachIndex, build_index, sha1_digest
+
+PASSWORDS = ['password', '123456', 'qwerty', 'letmein', 'hunter2']
+
+def write_index(path, passwords):
+    digests = sorted(sha1_digest(password) for password in passwords)
+    dump = io.StringIO(''.join(f'{digest.hex().upper()}:42\r\n' for digest in digests))
+    with open(path, 'wb') as dest:
+        return build_index(dump, dest)
+
+def test_build_index_and_lookup(tmp_path):
+    path = tmp_path / 'breached.bin'
+    assert write_index(path, PASSWORDS + ['password']) == len(PASSWORDS)
+
+    index = BreachIndex(str(path))
+
+    assert len(index) == len(PASSWORDS)
+    assert all(index.contains(password) for password in PASSWORDS)
+    assert not index.contains('correct horse battery staple')
+    assert index.contains_many(['hunter2', 'not breached', 'qwerty']) == [True, False, True]
+    index.close()
+
+def test_build_index_rejects_unsorted_dump(tmp_path):
+    digests = sorted(sha1_digest(password) for password in PASSWORDS)
+    dump = io.StringIO(''.join(f'{digest.hex()}\n' for digest in reversed(digests)))
+
+    with open(tmp_path / 'breached.bin', 'wb') as dest:
+        with pytest.raises(ValueError):
+            build_index(dump, dest)
+
+@pytest.mark.parametrize('content', [b'', b'short', b'not an index' * 10, b'not an index' * 50000])
+def test_open_rejects_invalid_file(tmp_path, content):
+    path = tmp_path / 'breached.bin'
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        BreachIndex(str(path))
+
+def test_open_rejects_truncated_file(tmp_path):
+    path = tmp_path / 'breached.bin'
+    write_index(path, PASSWORDS)
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        BreachIndex(str(path))
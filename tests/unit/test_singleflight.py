@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from src.singleflight import SingleFlight, make_key
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_result():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b'body'
+
+    key = make_key('/secrets', 'owner')
+    results = await asyncio.gather(*[single_flight.do(key, fetch) for _ in range(5)])
+
+    assert results == [b'body'] * 5
+    assert calls == 1
+    assert single_flight.snapshot() == [{
+        'route': '/secrets',
+        'calls': 1,
+        'shared': 4,
+        'invalidations': 0,
+        'coalescing_rate': 0.8
+    }]
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return object()
+
+    first, second = await asyncio.gather(
+        single_flight.do(make_key('/secrets', 'a'), fetch),
+        single_flight.do(make_key('/secrets', 'a', [('page', '2')]), fetch),
+    )
+
+    assert first is not second
+
+@pytest.mark.asyncio
+async def test_invalidate_starts_new_call():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.01)
+        return call
+
+    key = make_key('/secrets', 'owner')
+    first = asyncio.ensure_future(single_flight.do(key, fetch))
+    await asyncio.sleep(0)
+    single_flight.invalidate('/secrets', 'owner')
+    second = await single_flight.do(key, fetch)
+
+    assert await first == 1
+    assert second == 2
+
+@pytest.mark.asyncio
+async def test_exception_is_shared():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    key = make_key('user', 'owner')
+    results = await asyncio.gather(*[single_flight.do(key, fetch) for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert single_flight._calls == {}
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return 'ok'
+
+    key = make_key('user', 'owner')
+    leader = asyncio.ensure_future(single_flight.do(key, fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(single_flight.do(key, fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 'ok'